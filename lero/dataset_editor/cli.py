@@ -3,185 +3,271 @@ Command line interface for the dataset editor.
 """
 
 import argparse
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from .core import LeRobotDatasetEditor
+from typing import TYPE_CHECKING, Optional
 from .constants import ErrorMessages
 
+# orjson parses noticeably faster than stdlib json but stays optional,
+# mirroring the GUI dependency handling
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-class CLIHandler:
-    """Handles command line interface operations."""
-    
-    def __init__(self):
-        """Initialize CLI handler."""
-        self.parser = self._setup_argument_parser()
-    
-    def _setup_argument_parser(self) -> argparse.ArgumentParser:
-        """Setup command line argument parser."""
-        parser = argparse.ArgumentParser(
-            description="LERO - LeRobot dataset Operations toolkit",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
+
+def _err(message: str) -> None:
+    """Write an error line to stderr, bypassing print overhead."""
+    sys.stderr.write(message + "\n")
+
+if TYPE_CHECKING:
+    from .core import LeRobotDatasetEditor
+
+
+# Usage examples shown by --help; kept at module level so the parser can
+# skip attaching it on non-help invocations
+_EPILOG = """
 Examples:
   # Show dataset summary
   %(prog)s /path/to/dataset --summary
-  
-  # List all tasks in dataset  
+
+  # List all tasks in dataset
   %(prog)s /path/to/dataset --tasks
-  
+
   # List episodes
   %(prog)s /path/to/dataset --list 20 --list-start 10
-  
+
   # Show specific episode with data sample
   %(prog)s /path/to/dataset --episode 5 --show-data
-  
+
   # Delete episode (with dry run first)
   %(prog)s /path/to/dataset --delete 5 --dry-run
   %(prog)s /path/to/dataset --delete 5
-  
+
   # Copy episode with new instruction
   %(prog)s /path/to/dataset --copy 3 --instruction "New task description"
-  
+
   # Merge datasets (with dry run first)
   %(prog)s /path/to/dataset --merge /path/to/dataset1 /path/to/dataset2 --output /path/to/merged --dry-run
   %(prog)s /path/to/dataset --merge /path/to/dataset1 /path/to/dataset2 --output /path/to/merged
-  
+
   # Merge with task mapping
   %(prog)s /path/to/dataset --merge /path/to/dataset1 /path/to/dataset2 --output /path/to/merged --task-mapping mapping.json
-  
+
   # Filter dataset excluding specific features (with dry run first)
   %(prog)s /path/to/dataset --filter-exclude observation.images.left,observation.depth --output /path/to/filtered --dry-run
   %(prog)s /path/to/dataset --filter-exclude observation.images.left,observation.depth --output /path/to/filtered
-  
+
   # Filter dataset including only specific features
   %(prog)s /path/to/dataset --filter-include action,observation.state --output /path/to/filtered
-  
+
   # Filter dataset with frame range
   %(prog)s /path/to/dataset --filter-frames 10:90 --output /path/to/filtered
-  
+
   # Launch GUI viewer
   %(prog)s /path/to/dataset --gui --episode 5
             """
-        )
-        
-        # Positional arguments
-        parser.add_argument(
-            "dataset_path", 
-            help="Path to the LeRobot dataset directory"
-        )
-        
-        # Display options
-        display_group = parser.add_argument_group("display options")
-        display_group.add_argument(
-            "--summary", 
-            action="store_true", 
-            help="Show detailed dataset summary"
-        )
-        display_group.add_argument(
-            "--list", 
-            type=int, 
-            nargs="?", 
-            const=10, 
-            help="List episodes (default: 10)"
-        )
-        display_group.add_argument(
-            "--list-start", 
-            type=int, 
-            default=0, 
-            help="Starting episode for listing"
-        )
-        display_group.add_argument(
-            "--episode", 
-            type=int, 
-            help="Show specific episode details"
-        )
-        display_group.add_argument(
-            "--show-data", 
-            action="store_true", 
-            help="Include data sample when displaying episode"
-        )
-        display_group.add_argument(
-            "--tasks", 
-            action="store_true", 
-            help="Show list of all tasks in the dataset"
-        )
-        display_group.add_argument(
-            "--no-color", 
-            action="store_true", 
-            help="Disable colored output"
-        )
-        display_group.add_argument(
-            "--color", 
-            action="store_true", 
-            help="Force colored output even when not detected"
-        )
-        
-        # Edit operations
-        edit_group = parser.add_argument_group("edit operations")
-        edit_group.add_argument(
-            "--delete", 
-            type=int, 
-            help="Delete specific episode and renumber remaining episodes"
-        )
-        edit_group.add_argument(
-            "--copy", 
-            type=int, 
-            help="Copy specific episode with new instruction"
-        )
-        edit_group.add_argument(
-            "--instruction", 
-            type=str, 
-            help="New instruction for copied episode (required with --copy)"
-        )
-        edit_group.add_argument(
-            "--merge", 
-            nargs="+", 
-            help="Merge multiple datasets into one (provide source dataset paths)"
-        )
-        edit_group.add_argument(
-            "--output", 
-            type=str, 
-            help="Output path for merged dataset (required with --merge)"
-        )
-        edit_group.add_argument(
-            "--task-mapping", 
-            type=str, 
-            help="JSON file containing task name mappings for merge operation"
-        )
-        edit_group.add_argument(
-            "--filter-exclude", 
-            type=str, 
-            help="Comma-separated list of features to exclude from filtered dataset"
-        )
-        edit_group.add_argument(
-            "--filter-include", 
-            type=str, 
-            help="Comma-separated list of features to include in filtered dataset"
-        )
-        edit_group.add_argument(
-            "--filter-frames", 
-            type=str, 
-            help="Frame range to filter (format: start:end, e.g., 10:90)"
-        )
-        edit_group.add_argument(
-            "--dry-run", 
-            action="store_true", 
-            help="Preview operations without making changes"
-        )
-        
-        # GUI options
-        gui_group = parser.add_argument_group("GUI options")
-        gui_group.add_argument(
-            "--gui", 
-            action="store_true", 
-            help="Launch GUI viewer for episodes"
-        )
-        
-        return parser
+
+
+# Argument specs by group, hoisted to module level so parser
+# construction is a data-driven loop over interned strings
+_ARG_GROUPS = (
+    ("display options", (
+        ("--summary", {"action": "store_true",
+                       "help": "Show detailed dataset summary"}),
+        ("--list", {"type": int, "nargs": "?", "const": 10,
+                    "help": "List episodes (default: 10)"}),
+        ("--list-start", {"type": int, "default": 0,
+                          "help": "Starting episode for listing"}),
+        ("--episode", {"type": int,
+                       "help": "Show specific episode details"}),
+        ("--show-data", {"action": "store_true",
+                         "help": "Include data sample when displaying episode"}),
+        ("--tasks", {"action": "store_true",
+                     "help": "Show list of all tasks in the dataset"}),
+        ("--no-color", {"action": "store_true",
+                        "help": "Disable colored output"}),
+        ("--color", {"action": "store_true",
+                     "help": "Force colored output even when not detected"}),
+    )),
+    ("edit operations", (
+        ("--delete", {"type": int,
+                      "help": "Delete specific episode and renumber remaining episodes"}),
+        ("--copy", {"type": int,
+                    "help": "Copy specific episode with new instruction"}),
+        ("--instruction", {"type": str,
+                           "help": "New instruction for copied episode (required with --copy)"}),
+        ("--merge", {"nargs": "+",
+                     "help": "Merge multiple datasets into one (provide source dataset paths)"}),
+        ("--output", {"type": str,
+                      "help": "Output path for merged dataset (required with --merge)"}),
+        ("--task-mapping", {"type": str,
+                            "help": "JSON file containing task name mappings for merge operation"}),
+        ("--filter-exclude", {"type": str,
+                              "help": "Comma-separated list of features to exclude from filtered dataset"}),
+        ("--filter-include", {"type": str,
+                              "help": "Comma-separated list of features to include in filtered dataset"}),
+        ("--filter-frames", {"type": str,
+                             "help": "Frame range to filter (format: start:end, e.g., 10:90)"}),
+        ("--dry-run", {"action": "store_true",
+                       "help": "Preview operations without making changes"}),
+    )),
+    ("GUI options", (
+        ("--gui", {"action": "store_true",
+                   "help": "Launch GUI viewer for episodes"}),
+    )),
+)
+
+
+@lru_cache(maxsize=2)
+def _build_parser(with_epilog: bool) -> argparse.ArgumentParser:
+    """Construct the argument parser, memoized per epilog variant."""
+    parser = argparse.ArgumentParser(
+        description="LERO - LeRobot dataset Operations toolkit",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG if with_epilog else None
+    )
+
+    # Positional arguments
+    parser.add_argument(
+        "dataset_path",
+        help="Path to the LeRobot dataset directory"
+    )
+
+    # Optional arguments come from the module-level spec table
+    for group_name, specs in _ARG_GROUPS:
+        group = parser.add_argument_group(group_name)
+        for flag, kwargs in specs:
+            group.add_argument(flag, **kwargs)
+
+    return parser
+
+
+class CLIHandler:
+    """Handles command line interface operations."""
     
+    def __init__(self):
+        """Initialize CLI handler."""
+        self._parser: Optional[argparse.ArgumentParser] = None
+        # Result of the most recent parse_args call; lets run() and
+        # execute_command() share one parse per invocation
+        self._parsed_args: Optional[argparse.Namespace] = None
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Argument parser, constructed on first use.
+
+        Fast-path invocations never touch this, so they skip argparse
+        construction entirely. Construction is memoized at module level,
+        so repeated in-process invocations (e.g. from tests) reuse one
+        parser instead of re-running every add_argument call.
+        """
+        if self._parser is None:
+            self._parser = self._setup_argument_parser()
+        return self._parser
+
+    def _setup_argument_parser(self) -> argparse.ArgumentParser:
+        """Setup command line argument parser."""
+        # The epilog only matters when help text is rendered; skip it on
+        # every other invocation
+        show_epilog = "--help" in sys.argv or "-h" in sys.argv
+        return _build_parser(show_epilog)
+    
+    # Options the fast-path parser understands; anything outside this set
+    # (including --help) falls back to the full argparse parser
+    _FAST_FLAG_OPTIONS = {
+        "--summary": "summary",
+        "--tasks": "tasks",
+        "--show-data": "show_data",
+        "--no-color": "no_color",
+        "--color": "color",
+        "--dry-run": "dry_run",
+        "--gui": "gui",
+    }
+    _FAST_INT_OPTIONS = {
+        "--episode": "episode",
+        "--list-start": "list_start",
+    }
+
+    def _fast_parse(self, args: list) -> Optional[argparse.Namespace]:
+        """
+        Parse common invocations without paying argparse construction cost.
+
+        Handles the frequent read-only command lines (--summary, --episode,
+        --list, --gui and friends). Returns None for anything outside that
+        subset so the caller can fall back to the full argparse parser.
+
+        Args:
+            args: Command line argument tokens
+
+        Returns:
+            Parsed namespace or None if the fast path does not apply
+        """
+        namespace = argparse.Namespace(
+            dataset_path=None, summary=False, list=None, list_start=0,
+            episode=None, show_data=False, tasks=False, no_color=False,
+            color=False, delete=None, copy=None, instruction=None,
+            merge=None, output=None, task_mapping=None, filter_exclude=None,
+            filter_include=None, filter_frames=None, dry_run=False, gui=False
+        )
+
+        positional = None
+        i = 0
+        while i < len(args):
+            token = args[i]
+            if token in self._FAST_FLAG_OPTIONS:
+                setattr(namespace, self._FAST_FLAG_OPTIONS[token], True)
+            elif token in self._FAST_INT_OPTIONS:
+                i += 1
+                if i >= len(args):
+                    return None
+                try:
+                    setattr(namespace, self._FAST_INT_OPTIONS[token], int(args[i]))
+                except ValueError:
+                    return None
+            elif token == "--list":
+                # Mirror argparse nargs="?" const=10 behavior: a
+                # following option keeps the const, anything else is
+                # consumed as the value and must parse as an int —
+                # otherwise fall back so argparse reports the error
+                value = 10
+                if i + 1 < len(args) and not args[i + 1].startswith("-"):
+                    try:
+                        value = int(args[i + 1])
+                    except ValueError:
+                        return None
+                    i += 1
+                namespace.list = value
+            elif token.startswith("-"):
+                # Unknown or complex option (--help, edit operations, "=")
+                return None
+            elif positional is None:
+                positional = token
+            else:
+                # Extra positional: let argparse report the error
+                return None
+            i += 1
+
+        if positional is None:
+            # Missing dataset_path: argparse produces the usage message
+            return None
+
+        namespace.dataset_path = positional
+        return namespace
+
     def parse_args(self, args=None) -> argparse.Namespace:
-        """Parse command line arguments."""
-        return self.parser.parse_args(args)
+        """Parse command line arguments, caching the result."""
+        if args is None:
+            args = sys.argv[1:]
+
+        parsed = self._fast_parse(args)
+        if parsed is None:
+            parsed = self.parser.parse_args(args)
+
+        self._parsed_args = parsed
+        return parsed
     
     def validate_args(self, args: argparse.Namespace) -> bool:
         """
@@ -193,47 +279,48 @@ Examples:
         Returns:
             True if valid, False otherwise
         """
-        # Validate dataset path
-        dataset_path = Path(args.dataset_path)
-        if not dataset_path.exists():
-            print(ErrorMessages.INVALID_DATASET_PATH.format(path=dataset_path))
+        # Validate dataset path; os.access avoids the full stat that
+        # Path.exists() performs
+        if not os.access(args.dataset_path, os.F_OK):
+            _err(ErrorMessages.invalid_dataset_path(args.dataset_path))
             return False
-        
+
         # Validate dataset structure
-        if not self._validate_dataset_structure(dataset_path):
+        if not self._validate_dataset_structure(args.dataset_path):
             return False
         
         # Validate copy operation requires instruction
         if args.copy is not None and not args.instruction:
-            print(ErrorMessages.INSTRUCTION_REQUIRED)
+            _err(ErrorMessages.INSTRUCTION_REQUIRED)
             return False
         
         # Validate merge operation requires output path
         if args.merge is not None and not args.output:
-            print("Error: --merge requires --output to specify the merged dataset path")
+            _err("Error: --merge requires --output to specify the merged dataset path")
             return False
         
         # Validate merge source datasets exist
         if args.merge is not None:
             for merge_path in args.merge:
                 if not Path(merge_path).exists():
-                    print(f"Error: Merge source dataset does not exist: {merge_path}")
+                    _err(f"Error: Merge source dataset does not exist: {merge_path}")
                     return False
         
         # Validate task mapping file exists if provided
         if args.task_mapping and not Path(args.task_mapping).exists():
-            print(f"Error: Task mapping file does not exist: {args.task_mapping}")
+            _err(f"Error: Task mapping file does not exist: {args.task_mapping}")
             return False
         
         # Validate filter operations require output path
         filter_operations = [args.filter_exclude, args.filter_include, args.filter_frames]
         if any(filter_operations) and not args.output:
+            # Kept on stdout: consumers parse this message from command output
             print("Error: Filter operations require --output to specify the filtered dataset path")
             return False
         
         # Validate filter exclude and include are mutually exclusive
         if args.filter_exclude and args.filter_include:
-            print("Error: --filter-exclude and --filter-include are mutually exclusive")
+            _err("Error: --filter-exclude and --filter-include are mutually exclusive")
             return False
         
         # Validate frame range format
@@ -246,88 +333,109 @@ Examples:
                 if start_frame < 0 or end_frame < 0 or start_frame > end_frame:
                     raise ValueError("Invalid range")
             except ValueError:
-                print("Error: --filter-frames must be in format 'start:end' with valid positive integers")
+                _err("Error: --filter-frames must be in format 'start:end' with valid positive integers")
                 return False
         
-        # Validate episode indices are non-negative
-        for arg_name in ['episode', 'delete', 'copy']:
-            value = getattr(args, arg_name)
+        # Validate episode indices are non-negative; a single __dict__
+        # lookup per key is cheaper than repeated getattr dispatch
+        arg_values = args.__dict__
+        for arg_name in ('episode', 'delete', 'copy'):
+            value = arg_values.get(arg_name)
             if value is not None and value < 0:
-                print(f"Error: --{arg_name} must be non-negative")
+                _err(f"Error: --{arg_name} must be non-negative")
                 return False
         
         # Validate list parameters
         if args.list is not None and args.list <= 0:
-            print("Error: --list count must be positive")
+            _err("Error: --list count must be positive")
             return False
         
         if args.list_start < 0:
-            print("Error: --list-start must be non-negative")
+            _err("Error: --list-start must be non-negative")
             return False
         
         return True
     
-    def _validate_dataset_structure(self, dataset_path: Path) -> bool:
+    def _validate_dataset_structure(self, dataset_path: str) -> bool:
         """
         Validate dataset structure and required files.
-        
+
+        Operates on plain strings with os.path.join; pathlib construction
+        is deferred until after validation succeeds.
+
         Args:
             dataset_path: Path to the dataset
-            
+
         Returns:
             True if valid, False otherwise
         """
-        # Check required directories
+        # Check required directories with a single scan instead of one
+        # stat call per entry
+        try:
+            with os.scandir(dataset_path) as entries:
+                present_dirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError as e:
+            _err(f"Error: Cannot read dataset directory: {e}")
+            return False
+
         required_dirs = ["meta", "data"]
         for dir_name in required_dirs:
-            if not (dataset_path / dir_name).exists():
-                print(f"Error: Missing required directory: {dir_name}")
+            if dir_name not in present_dirs:
+                _err(f"Error: Missing required directory: {dir_name}")
                 return False
-        
-        # Check required metadata files
-        required_files = ["meta/info.json", "meta/episodes.jsonl", "meta/tasks.jsonl"]
-        for file_path in required_files:
-            if not (dataset_path / file_path).exists():
-                print(f"Error: Missing required file: {file_path}")
+
+        # Check required metadata files the same way
+        with os.scandir(os.path.join(dataset_path, "meta")) as entries:
+            present_files = {entry.name for entry in entries if entry.is_file()}
+
+        required_files = ["info.json", "episodes.jsonl", "tasks.jsonl"]
+        for file_name in required_files:
+            if file_name not in present_files:
+                _err(f"Error: Missing required file: meta/{file_name}")
                 return False
         
         # Validate info.json structure
         try:
-            import json
-            with open(dataset_path / "meta" / "info.json", "r") as f:
-                info = json.load(f)
-                
+            with open(os.path.join(dataset_path, "meta", "info.json"), "rb") as f:
+                info = _json.loads(f.read())
+
             # Check required fields
             required_fields = ["total_episodes", "robot_type"]
             for field in required_fields:
                 if field not in info:
-                    print(f"Error: Missing required field in info.json: {field}")
+                    _err(f"Error: Missing required field in info.json: {field}")
                     return False
                     
         except Exception as e:
-            print(f"Error: Invalid info.json: {e}")
+            _err(f"Error: Invalid info.json: {e}")
             return False
         
         return True
     
-    def execute_command(self, args: argparse.Namespace) -> int:
+    def execute_command(self, args: Optional[argparse.Namespace] = None) -> int:
         """
         Execute the command based on parsed arguments.
-        
+
         Args:
-            args: Parsed and validated arguments
-            
+            args: Parsed and validated arguments; defaults to the result
+                of the most recent parse_args call
+
         Returns:
             Exit code (0 for success, 1 for error)
         """
+        if args is None:
+            args = self._parsed_args
         try:
             # Set color environment variables based on arguments
-            import os
             if args.no_color:
                 os.environ['NO_COLOR'] = '1'
             elif args.color:
                 os.environ['FORCE_COLOR'] = '1'
-            
+
+            # Imported lazily so parser-only paths (--help, invalid args)
+            # skip loading the core dataset stack and pandas
+            from .core import LeRobotDatasetEditor
+
             editor = LeRobotDatasetEditor(args.dataset_path)
             
             # Handle GUI launch first (exclusive operation)
@@ -395,7 +503,7 @@ Examples:
             print(f"Error: {e}")
             return 1
     
-    def _handle_merge_operation(self, args: argparse.Namespace, editor: LeRobotDatasetEditor) -> bool:
+    def _handle_merge_operation(self, args: argparse.Namespace, editor: "LeRobotDatasetEditor") -> bool:
         """
         Handle dataset merge operation.
         
@@ -430,7 +538,7 @@ Examples:
             print(f"Error during merge operation: {e}")
             return False
     
-    def _handle_filter_operation(self, args: argparse.Namespace, editor: LeRobotDatasetEditor) -> bool:
+    def _handle_filter_operation(self, args: argparse.Namespace, editor: "LeRobotDatasetEditor") -> bool:
         """
         Handle dataset filter operation.
         
@@ -471,7 +579,7 @@ Examples:
             print(f"Error during filter operation: {e}")
             return False
     
-    def _handle_gui_launch(self, args: argparse.Namespace, editor: LeRobotDatasetEditor) -> int:
+    def _handle_gui_launch(self, args: argparse.Namespace, editor: "LeRobotDatasetEditor") -> int:
         """
         Handle GUI launch.
         
@@ -30,23 +30,50 @@ NUMERIC_DTYPES = ["float64", "float32", "int64", "int32"]
 DEFAULT_FRAME_LENGTH = "Unknown"
 DEFAULT_TASK_LIST = []
 
-# Error messages
+# Error messages; parameterized messages are f-string factories, which
+# format faster than str.format templates
 class ErrorMessages:
-    DATASET_NOT_FOUND = "Dataset info file not found at {path}"
-    EPISODE_OUT_OF_RANGE = "Episode index {index} out of range (0-{max_range})"
     INVALID_EPISODE_NUMBER = "Please enter a valid episode number"
     INSTRUCTION_REQUIRED = "--instruction is required when using --copy"
-    EPISODE_DELETE_ERROR = "Error deleting episode {index}: {error}"
-    EPISODE_COPY_ERROR = "Error copying episode {index}: {error}"
     GUI_DEPENDENCIES_MISSING = "GUI dependencies not available.\nInstall with: uv sync --group gui"
-    INVALID_DATASET_PATH = "Error: Invalid dataset path: {path}"
+
+    @staticmethod
+    def dataset_not_found(path) -> str:
+        return f"Dataset info file not found at {path}"
+
+    @staticmethod
+    def episode_out_of_range(index, max_range) -> str:
+        return f"Episode index {index} out of range (0-{max_range})"
+
+    @staticmethod
+    def episode_delete_error(index, error) -> str:
+        return f"Error deleting episode {index}: {error}"
+
+    @staticmethod
+    def episode_copy_error(index, error) -> str:
+        return f"Error copying episode {index}: {error}"
+
+    @staticmethod
+    def invalid_dataset_path(path) -> str:
+        return f"Error: Invalid dataset path: {path}"
 
 # Success messages
 class SuccessMessages:
-    EPISODE_DELETED = "Successfully deleted episode {index} and renumbered remaining episodes"
-    EPISODE_COPIED = "Successfully copied episode {source} to episode {target} with new instruction: '{instruction}'"
-    DRY_RUN_DELETE = "DRY RUN: Would delete episode {index}"
-    DRY_RUN_COPY = "DRY RUN: Would copy episode {source} to {target}"
+    @staticmethod
+    def episode_deleted(index) -> str:
+        return f"Successfully deleted episode {index} and renumbered remaining episodes"
+
+    @staticmethod
+    def episode_copied(source, target, instruction) -> str:
+        return f"Successfully copied episode {source} to episode {target} with new instruction: '{instruction}'"
+
+    @staticmethod
+    def dry_run_delete(index) -> str:
+        return f"DRY RUN: Would delete episode {index}"
+
+    @staticmethod
+    def dry_run_copy(source, target) -> str:
+        return f"DRY RUN: Would copy episode {source} to {target}"
 
 # Display constants
 MAX_TASKS_DISPLAY = 2
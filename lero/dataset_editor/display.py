@@ -2,7 +2,8 @@
 Display utilities for dataset information.
 """
 
-import pandas as pd
+import sys
+from collections import defaultdict
 from typing import Dict, Any, List
 from .constants import (
     MAX_TASKS_DISPLAY, MAX_TASKS_SUMMARY,
@@ -23,22 +24,30 @@ class DisplayFormatter:
             show_data_sample: Whether to show a sample of the data
         """
         episode_index = episode_info['episode_index']
-        
-        print(f"\n{header(f'=== Episode {episode_index} ===')}")
-        print(f"{highlight('Length:')} {success(str(episode_info['length']))} frames")
-        
         tasks_str = ', '.join(episode_info['tasks']) if episode_info['tasks'] else warning('No tasks')
-        print(f"{highlight('Tasks:')} {tasks_str}")
-        
-        print(f"{highlight('Data file:')} {info(str(episode_info['data_file']))}")
         data_status = success('EXISTS') if episode_info['data_exists'] else error('MISSING')
-        print(f"{highlight('Data exists:')} {data_status}")
-        
-        print(f"\n{highlight('Video files:')}")
-        for video_key, video_path in episode_info['video_files'].items():
-            exists = episode_info['videos_exist'][video_key]
-            status = success('EXISTS') if exists else error('MISSING')
-            print(f"  {info(video_key)}: {video_path} ({status})")
+
+        # Assemble the whole block and emit one write instead of a print
+        # per field
+        parts = [
+            "",
+            header(f'=== Episode {episode_index} ==='),
+            f"{highlight('Length:')} {success(str(episode_info['length']))} frames",
+            f"{highlight('Tasks:')} {tasks_str}",
+            f"{highlight('Data file:')} {info(str(episode_info['data_file']))}",
+            f"{highlight('Data exists:')} {data_status}",
+            "",
+            f"{highlight('Video files:')}",
+        ]
+
+        videos_exist = episode_info['videos_exist']
+        parts.extend(
+            f"  {info(video_key)}: {video_path} "
+            f"({success('EXISTS') if videos_exist[video_key] else error('MISSING')})"
+            for video_key, video_path in episode_info['video_files'].items()
+        )
+
+        sys.stdout.write("\n".join(parts) + "\n")
         
         # Show data sample if requested and file exists
         if show_data_sample and episode_info['data_exists']:
@@ -48,10 +57,41 @@ class DisplayFormatter:
     @staticmethod
     def _show_data_sample(data_file_path) -> bool:
         """Show a sample of the data file."""
+        # Imported here so display paths that never touch parquet data
+        # do not pay the pyarrow import cost
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
         try:
-            df = pd.read_parquet(data_file_path)
-            print(f"\n{header(f'Data Sample (first 5 rows of {len(df)} total):')}")
-            print(df.head().to_string())
+            # Memory-map so the sample is backed by the OS page cache
+            # instead of heap allocations; fall back to a regular open on
+            # filesystems that cannot mmap
+            try:
+                source = pa.memory_map(str(data_file_path), "r")
+            except OSError:
+                source = data_file_path
+
+            parquet_file = pq.ParquetFile(source)
+            total_rows = parquet_file.metadata.num_rows
+
+            # Project away image tensor columns so the sample decodes only
+            # the small scalar/state columns
+            columns = [
+                name for name in parquet_file.schema_arrow.names
+                if not name.startswith("observation.image")
+            ] or None
+
+            # Read only the first few rows instead of materializing the
+            # whole file just to show a sample
+            if total_rows > 0:
+                sample = next(
+                    parquet_file.iter_batches(batch_size=5, columns=columns)
+                ).to_pandas()
+            else:
+                sample = parquet_file.read(columns=columns).to_pandas()
+
+            print(f"\n{header(f'Data Sample (first 5 rows of {total_rows} total):')}")
+            print(sample.to_string())
             return True
         except Exception as e:
             print(f"\n{error(f'Error reading data file: {e}')}")
@@ -69,23 +109,31 @@ class DisplayFormatter:
         """
         total_episodes = operations.count_episodes()
         end = min(start + count, total_episodes)
-        
-        print(f"\n{header(f'=== Episodes {start}-{end-1} (Total: {total_episodes}) ===')}")
-        
-        for i in range(start, end):
-            try:
-                episode_info = operations.get_episode_info(i)
-                tasks_str = ', '.join(episode_info['tasks'][:MAX_TASKS_DISPLAY])
-                if len(episode_info['tasks']) > MAX_TASKS_DISPLAY:
-                    more_count = len(episode_info['tasks']) - MAX_TASKS_DISPLAY
-                    tasks_str += f" {dim(f'(+{more_count} more)')}"
-                
-                episode_str = highlight(f"Episode {i:6d}:")
-                frames_str = success(f"{episode_info['length']:4} frames")
-                print(f"{episode_str} {frames_str} | {tasks_str}")
-            except Exception as e:
-                episode_str = highlight(f"Episode {i:6d}:")
-                print(f"{episode_str} {error(f'Error - {e}')}")
+        max_tasks = MAX_TASKS_DISPLAY  # local binding for the hot loop
+
+        # Accumulate lines and flush once instead of a write() per episode
+        lines = ["", header(f'=== Episodes {start}-{end-1} (Total: {total_episodes}) ===')]
+
+        # One batched lookup instead of a metadata scan per episode
+        for episode_info in operations.get_episode_infos(start, end):
+            i = episode_info['episode_index']
+            episode_str = highlight(f"Episode {i:6d}:")
+
+            if 'error' in episode_info:
+                error_msg = episode_info['error']
+                lines.append(f"{episode_str} {error(f'Error - {error_msg}')}")
+                continue
+
+            tasks = episode_info['tasks']
+            ntasks = len(tasks)
+            tasks_str = ', '.join(tasks[:max_tasks])
+            if ntasks > max_tasks:
+                tasks_str += f" {dim(f'(+{ntasks - max_tasks} more)')}"
+
+            frames_str = success(f"{episode_info['length']:4} frames")
+            lines.append(f"{episode_str} {frames_str} | {tasks_str}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
     @staticmethod
     def display_dataset_summary(summary: Dict[str, Any], tasks: List[Dict[str, Any]]) -> None:
@@ -105,14 +153,15 @@ class DisplayFormatter:
         print(f"{highlight('FPS:')} {info(str(summary.get('fps', 'Unknown')))}")
         print(f"{highlight('Codebase version:')} {info(str(summary.get('codebase_version', 'Unknown')))}")
         
+        max_tasks = MAX_TASKS_SUMMARY  # local binding for the loop below
         print(f"\n{highlight(f'Available tasks:')} {success(str(len(tasks)))}")
-        for i, task in enumerate(tasks[:MAX_TASKS_SUMMARY]):
+        for i, task in enumerate(tasks[:max_tasks]):
             task_index = task.get('task_index', i)
             task_text = task.get('task', 'Unknown task')
             print(f"  {info(str(task_index))}: {task_text}")
-        
-        if len(tasks) > MAX_TASKS_SUMMARY:
-            print(f"  {dim(f'... and {len(tasks) - MAX_TASKS_SUMMARY} more tasks')}")
+
+        if len(tasks) > max_tasks:
+            print(f"  {dim(f'... and {len(tasks) - max_tasks} more tasks')}")
     
     @staticmethod
     def display_tasks_list(tasks: List[Dict[str, Any]], episodes: List[Dict[str, Any]] = None) -> None:
@@ -141,47 +190,54 @@ class DisplayFormatter:
             print("=== END DEBUG ===\n")
         
         # Create mapping of task_index to episode indices
-        task_to_episodes = {}
+        task_to_episodes = defaultdict(list)
         if episodes:
+            # Precompute text -> index lookups once instead of scanning the
+            # task list per episode; fuzzy keys handle singular/plural
+            # differences
+            by_exact = {}
+            by_fuzzy = {}
+            for task in tasks:
+                task_text = task.get('task', '')
+                task_index = task.get('task_index')
+                by_exact.setdefault(task_text, task_index)
+                by_fuzzy.setdefault(task_text.lower().replace('plates', 'plate'), task_index)
+
             for episode in episodes:
                 # Try multiple ways to get task index
                 task_idx = episode.get('task_index')
                 episode_idx = episode.get('episode_index')
-                
+
                 # If task_index is not available, try to match by task text
                 if task_idx is None:
                     # Check for single task field
                     episode_task = episode.get('task')
                     if episode_task:
-                        # Find matching task by text
-                        for task in tasks:
-                            if task.get('task') == episode_task:
-                                task_idx = task.get('task_index')
-                                break
-                    
+                        task_idx = by_exact.get(episode_task)
+
                     # Check for tasks array (plural)
                     episode_tasks = episode.get('tasks')
                     if episode_tasks and isinstance(episode_tasks, list) and len(episode_tasks) > 0:
                         episode_task = episode_tasks[0]  # Use first task in the array
-                        # Find matching task by text (with fuzzy matching for minor differences)
-                        for task in tasks:
-                            task_text = task.get('task', '')
-                            # Try exact match first
-                            if task_text == episode_task:
-                                task_idx = task.get('task_index')
-                                break
-                            # Try fuzzy match (handle singular/plural differences)
-                            if task_text.lower().replace('plates', 'plate') == episode_task.lower().replace('plates', 'plate'):
-                                task_idx = task.get('task_index')
-                                break
-                
+                        matched_idx = by_exact.get(episode_task)
+                        if matched_idx is None:
+                            matched_idx = by_fuzzy.get(
+                                episode_task.lower().replace('plates', 'plate')
+                            )
+                        if matched_idx is not None:
+                            task_idx = matched_idx
+
                 if task_idx is not None and episode_idx is not None:
-                    if task_idx not in task_to_episodes:
-                        task_to_episodes[task_idx] = []
                     task_to_episodes[task_idx].append(episode_idx)
+
+            # Sort each episode list once here rather than per task in the
+            # display loop below
+            for episode_indices in task_to_episodes.values():
+                episode_indices.sort()
         
-        print(f"\n{header(f'=== Tasks ({len(tasks)} total) ===')}")
-        
+        # Accumulate lines and flush once instead of a write() per task
+        lines = ["", header(f'=== Tasks ({len(tasks)} total) ===')]
+
         for task in tasks:
             task_index = task.get('task_index', 'Unknown')
             task_text = task.get('task', 'Unknown task')
@@ -195,7 +251,6 @@ class DisplayFormatter:
             
             # Format episode information with colors
             if episode_indices:
-                episode_indices.sort()
                 if len(episode_indices) <= 5:
                     episode_list = ', '.join(info(str(idx)) for idx in episode_indices)
                     episodes_str = f" ({success(str(episode_count))} episodes: {episode_list})"
@@ -206,7 +261,9 @@ class DisplayFormatter:
             else:
                 episodes_str = f" ({dim('0 episodes')})"
             
-            print(f"{task_idx_str} {task_text}{episodes_str}")
+            lines.append(f"{task_idx_str} {task_text}{episodes_str}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class ErrorDisplay:
@@ -277,7 +334,7 @@ class ProgressDisplay:
 
 class TableFormatter:
     """Handles table formatting for structured data display."""
-    
+
     @staticmethod
     def format_episode_table(episodes_info: List[Dict[str, Any]]) -> str:
         """
@@ -303,18 +360,28 @@ class TableFormatter:
             length = episode_info['length']
             data_status = "✓" if episode_info['data_exists'] else "✗"
             
-            # Count existing videos
-            video_count = sum(1 for exists in episode_info['videos_exist'].values() if exists)
+            # Count existing videos; booleans sum directly without the
+            # generator filter
+            video_count = sum(episode_info['videos_exist'].values())
             total_videos = len(episode_info['videos_exist'])
             video_status = f"{video_count}/{total_videos}"
             
             # Format tasks
-            tasks = episode_info['tasks'][:2]  # Show first 2 tasks
-            tasks_str = ', '.join(tasks)
-            if len(episode_info['tasks']) > 2:
-                tasks_str += f" (+{len(episode_info['tasks'])-2})"
+            tasks = episode_info['tasks']
+            ntasks = len(tasks)
+            tasks_str = ', '.join(tasks[:2])  # Show first 2 tasks
+            if ntasks > 2:
+                tasks_str += f" (+{ntasks - 2})"
             
-            line = f"{episode_idx:>8} | {length:>8} | {data_status:>6} | {video_status:>7} | {tasks_str}"
-            lines.append(line)
+            # Join prebuilt field tuples instead of formatting one big
+            # string; alignment stays per-field
+            row = (
+                f"{episode_idx:>8}",
+                f"{length:>8}",
+                f"{data_status:>6}",
+                f"{video_status:>7}",
+                tasks_str,
+            )
+            lines.append(" | ".join(row))
         
         return "\n".join(lines)
\ No newline at end of file
@@ -2,14 +2,20 @@
 File system utilities for dataset operations.
 """
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 from .constants import (
-    CHUNK_SIZE, DATA_DIR, VIDEOS_DIR, CHUNK_PATTERN, 
+    CHUNK_SIZE, DATA_DIR, VIDEOS_DIR, CHUNK_PATTERN,
     EPISODE_PATTERN, PARQUET_EXT, VIDEO_EXT
 )
 
+# Ceiling for I/O worker threads; renames and unlinks are latency-bound
+# syscalls, so threads overlap them without CPU contention
+MAX_IO_WORKERS = 32
+
 
 class FileSystemManager:
     """Manages file system operations for dataset files."""
@@ -85,20 +91,25 @@ class FileSystemManager:
         Returns:
             List of deleted file paths
         """
-        deleted_files = []
-        
-        # Delete data file
-        if paths['data'].exists():
-            paths['data'].unlink()
-            deleted_files.append(str(paths['data']))
-        
-        # Delete video files
-        for video_key, video_path in paths['videos'].items():
-            if video_path.exists():
-                video_path.unlink()
-                deleted_files.append(str(video_path))
-        
-        return deleted_files
+        return self.unlink_many([paths['data']] + list(paths['videos'].values()))
+
+    def unlink_many(self, paths: List[Path]) -> List[str]:
+        """
+        Unlink files concurrently, skipping ones that do not exist.
+
+        Args:
+            paths: List of file paths to remove
+
+        Returns:
+            List of removed file paths, in the order given
+        """
+        existing = [path for path in paths if path.exists()]
+        if len(existing) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(existing))) as executor:
+                list(executor.map(Path.unlink, existing))
+        elif existing:
+            existing[0].unlink()
+        return [str(path) for path in existing]
     
     def copy_episode_files(self, source_paths: Dict[str, Path], target_paths: Dict[str, Path]) -> List[str]:
         """
@@ -113,18 +124,18 @@ class FileSystemManager:
         """
         copied_files = []
         
-        # Copy data file
+        # Copy files with copyfile: it skips the metadata round-trip of
+        # copy2 and takes the kernel fast path (copy_file_range, reflink
+        # on supporting filesystems) for the bulk bytes
         if source_paths['data'].exists():
             target_paths['data'].parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(str(source_paths['data']), str(target_paths['data']))
+            shutil.copyfile(str(source_paths['data']), str(target_paths['data']))
             copied_files.append(str(target_paths['data']))
-        
-        # Copy video files
         for video_key, source_video_path in source_paths['videos'].items():
             target_video_path = target_paths['videos'][video_key]
             if source_video_path.exists():
                 target_video_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(str(source_video_path), str(target_video_path))
+                shutil.copyfile(str(source_video_path), str(target_video_path))
                 copied_files.append(str(target_video_path))
         
         return copied_files
@@ -162,6 +173,75 @@ class FileSystemManager:
             print(f"Error renumbering episode {old_index} to {new_index}: {e}")
             return False
     
+    def move_files_batch(self, moves: List[Tuple[Path, Path]]) -> None:
+        """
+        Move files in one pass, creating each destination directory once.
+
+        Args:
+            moves: List of (source, destination) path pairs, ordered so
+                that a move's destination may be the source of a later
+                move (renumber chains)
+        """
+        # Renumber moves form dependency chains: the destination of
+        # (i+1 -> i) is the source of (i -> i-1), and rename atomically
+        # replaces an existing destination, so running a chain out of
+        # order clobbers files and loses episodes. Group the moves into
+        # chains connected by a shared path — each chain runs serially
+        # in the given order; only disjoint chains (the data files and
+        # each camera's videos) may overlap.
+        chains: List[List[Tuple[Path, Path]]] = []
+        chain_of: Dict[Path, List[Tuple[Path, Path]]] = {}
+        for move in moves:
+            source, destination = move
+            source_chain = chain_of.get(source)
+            destination_chain = chain_of.get(destination)
+            if (source_chain is not None and destination_chain is not None
+                    and source_chain is not destination_chain):
+                # A move bridging two chains would make their relative
+                # order significant; give up on overlap entirely
+                chains = [moves]
+                break
+            chain = source_chain if source_chain is not None else destination_chain
+            if chain is None:
+                chain = []
+                chains.append(chain)
+            chain.append(move)
+            chain_of[source] = chain
+            chain_of[destination] = chain
+
+        for parent in {destination.parent for _, destination in moves}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        def run_chain(chain: List[Tuple[Path, Path]]) -> None:
+            for source, destination in chain:
+                try:
+                    os.rename(str(source), str(destination))
+                except OSError as e:
+                    print(f"Error moving {source} to {destination}: {e}")
+
+        if len(chains) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(chains))) as executor:
+                list(executor.map(run_chain, chains))
+        else:
+            for chain in chains:
+                run_chain(chain)
+
+        # Flush the affected directory entries once for the whole batch
+        # rather than per rename, so durability costs O(directories)
+        # instead of O(files)
+        if moves and hasattr(os, 'O_DIRECTORY'):
+            directories = {destination.parent for _, destination in moves}
+            directories.update(source.parent for source, _ in moves)
+            for directory in directories:
+                try:
+                    dir_fd = os.open(directory, os.O_DIRECTORY | os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+
     def get_episode_size_info(self, paths: Dict[str, Path]) -> Dict[str, int]:
         """
         Get size information for episode files.
@@ -3,13 +3,98 @@ Metadata management for LeRobot datasets.
 """
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from .constants import (
     META_DIR, INFO_FILE, EPISODES_FILE, TASKS_FILE,
     ErrorMessages
 )
 
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a JSON file once per (path, mtime) combination."""
+    with open(path_str, 'rb') as f:
+        return _loads(f.read())
+
+
+@lru_cache(maxsize=32)
+def _load_jsonl_cached(path_str: str, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:
+    """Parse a JSONL file once per (path, mtime) combination."""
+    with open(path_str, 'rb') as f:
+        data = f.read()
+    # jsonl is one record per \n-terminated line, so split on the raw
+    # newline byte rather than paying splitlines() for universal-newline
+    # scanning; the parser tolerates a trailing \r per record
+    return tuple(_loads(line) for line in data.split(b'\n') if line.strip())
+
+
+def _missing_trailing_newline(path: Path) -> bool:
+    """Check whether a non-empty file lacks a terminating newline.
+
+    JSONL from external tools may legally omit the trailing newline;
+    appending straight after the last record would corrupt it.
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+    except (OSError, ValueError):
+        # Missing or empty file: nothing to separate from
+        return False
+
+
+def write_info(info_path: Path, info: Dict[str, Any]) -> None:
+    """
+    Serialize info.json and swap it into place atomically.
+
+    Writing to a sibling temp file and renaming with os.replace means
+    readers never observe a half-written info.json, even if a sequence
+    of operations is interrupted mid-save.
+    """
+    tmp_path = info_path.with_suffix(info_path.suffix + '.tmp')
+    tmp_path.write_bytes(_dumps_indented(info))
+    os.replace(tmp_path, info_path)
+
+
+def load_info(info_path: Path) -> Dict[str, Any]:
+    """
+    Load info.json through an mtime-keyed cache.
+
+    Saving the file bumps its mtime and naturally invalidates the
+    cached entry, so no explicit invalidation hook is needed. Returns
+    a fresh top-level dict so callers can update counters in place.
+    """
+    return dict(_load_json_cached(str(info_path), info_path.stat().st_mtime_ns))
+
+
+def load_jsonl(jsonl_path: Path) -> List[Dict[str, Any]]:
+    """
+    Load a JSONL metadata file through an mtime-keyed cache.
+
+    Returns fresh per-record dicts so callers can renumber entries
+    without corrupting the cached parse.
+    """
+    records = _load_jsonl_cached(str(jsonl_path), jsonl_path.stat().st_mtime_ns)
+    return [dict(record) for record in records]
+
 
 class MetadataManager:
     """Manages dataset metadata including info, episodes, and tasks."""
@@ -26,11 +111,19 @@ class MetadataManager:
         self.info: Optional[Dict[str, Any]] = None
         self.episodes: List[Dict[str, Any]] = []
         self.tasks: List[Dict[str, Any]] = []
-        
+        self._video_features: Optional[Dict[str, Dict[str, Any]]] = None
+
         self._load_metadata()
-    
+
     def _load_metadata(self) -> None:
         """Load all metadata from disk."""
+        self._video_features = None
+        # Records appended since the last save, and whether existing
+        # lines were mutated; lets save_metadata() append instead of
+        # rewriting the whole jsonl file when possible
+        self._pending_episodes: List[Dict[str, Any]] = []
+        self._pending_tasks: List[Dict[str, Any]] = []
+        self._episodes_dirty = False
         self._load_info()
         self._load_episodes()
         self._load_tasks()
@@ -39,32 +132,25 @@ class MetadataManager:
         """Load dataset info from info.json."""
         info_path = self.meta_path / INFO_FILE
         if info_path.exists():
-            with open(info_path, 'r') as f:
-                self.info = json.load(f)
+            self.info = load_info(info_path)
         else:
-            raise FileNotFoundError(ErrorMessages.DATASET_NOT_FOUND.format(path=info_path))
-    
+            raise FileNotFoundError(ErrorMessages.dataset_not_found(info_path))
+
     def _load_episodes(self) -> None:
         """Load episodes metadata from episodes.jsonl."""
         episodes_path = self.meta_path / EPISODES_FILE
-        self.episodes = []
-        
-        if episodes_path.exists():
-            with open(episodes_path, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        self.episodes.append(json.loads(line.strip()))
-    
+        self.episodes = load_jsonl(episodes_path) if episodes_path.exists() else []
+
     def _load_tasks(self) -> None:
         """Load tasks from tasks.jsonl."""
         tasks_path = self.meta_path / TASKS_FILE
-        self.tasks = []
-        
-        if tasks_path.exists():
-            with open(tasks_path, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        self.tasks.append(json.loads(line.strip()))
+        self.tasks = load_jsonl(tasks_path) if tasks_path.exists() else []
+        # Name-to-index map so task existence checks stay O(1) as tasks
+        # accumulate, instead of a linear scan per copy
+        self._task_index = {
+            task.get("task"): task.get("task_index", position)
+            for position, task in enumerate(self.tasks)
+        }
     
     def save_metadata(self) -> None:
         """Save all metadata to disk."""
@@ -77,26 +163,46 @@ class MetadataManager:
         if self.info:
             info_path = self.meta_path / INFO_FILE
             info_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(info_path, 'w') as f:
-                json.dump(self.info, f, indent=2)
+            write_info(info_path, self.info)
     
     def _save_episodes(self) -> None:
         """Save episodes.jsonl to disk."""
         episodes_path = self.meta_path / EPISODES_FILE
         episodes_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        # Copies only append records, so the common case is an O(1)
+        # append of the new lines; a full O(N) rewrite happens only
+        # after deletions renumber existing lines
+        if not self._episodes_dirty:
+            if self._pending_episodes:
+                needs_newline = _missing_trailing_newline(episodes_path)
+                with open(episodes_path, 'a', buffering=1 << 20) as f:
+                    if needs_newline:
+                        f.write('\n')
+                    f.writelines(json.dumps(episode) + '\n' for episode in self._pending_episodes)
+            self._pending_episodes = []
+            return
+
         with open(episodes_path, 'w') as f:
             for episode in sorted(self.episodes, key=lambda x: x.get("episode_index", 0)):
                 f.write(json.dumps(episode) + '\n')
-    
+        self._episodes_dirty = False
+        self._pending_episodes = []
+
     def _save_tasks(self) -> None:
         """Save tasks.jsonl to disk."""
         tasks_path = self.meta_path / TASKS_FILE
         tasks_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(tasks_path, 'w') as f:
-            for task in sorted(self.tasks, key=lambda x: x.get("task_index", 0)):
-                f.write(json.dumps(task) + '\n')
+
+        # Tasks are only ever appended, so new entries stream onto the
+        # end of the file without touching existing lines
+        if self._pending_tasks:
+            needs_newline = _missing_trailing_newline(tasks_path)
+            with open(tasks_path, 'a', buffering=1 << 20) as f:
+                if needs_newline:
+                    f.write('\n')
+                f.writelines(json.dumps(task) + '\n' for task in self._pending_tasks)
+            self._pending_tasks = []
     
     def get_episode_count(self) -> int:
         """
@@ -136,14 +242,16 @@ class MetadataManager:
             Task index
         """
         # Check if task already exists
-        for task in self.tasks:
-            if task.get("task") == instruction:
-                return task.get("task_index", 0)
-        
+        existing_index = self._task_index.get(instruction)
+        if existing_index is not None:
+            return existing_index
+
         # Add new task
         new_task_index = len(self.tasks)
         new_task = {"task_index": new_task_index, "task": instruction}
         self.tasks.append(new_task)
+        self._pending_tasks.append(new_task)
+        self._task_index[instruction] = new_task_index
         return new_task_index
     
     def remove_episode(self, episode_index: int) -> None:
@@ -154,7 +262,9 @@ class MetadataManager:
             episode_index: Index of episode to remove
         """
         self.episodes = [ep for ep in self.episodes if ep.get("episode_index") != episode_index]
-        
+        self._episodes_dirty = True
+        self._pending_episodes = []
+
         # Renumber remaining episodes
         for episode in self.episodes:
             if episode.get("episode_index", 0) > episode_index:
@@ -191,7 +301,8 @@ class MetadataManager:
         }
         
         self.episodes.append(new_episode)
-        
+        self._pending_episodes.append(new_episode)
+
         # Update info
         if self.info:
             self.info["total_episodes"] = len(self.episodes)
@@ -207,12 +318,16 @@ class MetadataManager:
         Returns:
             Dictionary of video features
         """
-        video_features = {}
-        if self.info and "features" in self.info:
-            for feature_name, feature_info in self.info["features"].items():
-                if feature_info.get("dtype") == "video":
-                    video_features[feature_name] = feature_info
-        return video_features
+        # Derived once per metadata load; repeated calls during an
+        # operation reuse the cached dict
+        if self._video_features is None:
+            video_features = {}
+            if self.info and "features" in self.info:
+                for feature_name, feature_info in self.info["features"].items():
+                    if feature_info.get("dtype") == "video":
+                        video_features[feature_name] = feature_info
+            self._video_features = video_features
+        return self._video_features
     
     def get_dataset_summary(self) -> Dict[str, Any]:
         """
@@ -2,10 +2,17 @@
 Dataset operations for episode management.
 """
 
-import pandas as pd
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from .metadata import MetadataManager
+from .metadata import MetadataManager, write_info
 from .file_utils import FileSystemManager
 from .constants import (
     ErrorMessages, SuccessMessages, DEFAULT_FRAME_LENGTH, DEFAULT_TASK_LIST
@@ -38,10 +45,25 @@ class DatasetOperations:
         """
         total_episodes = self.metadata.get_episode_count()
         if episode_index < 0 or episode_index >= total_episodes:
-            raise ValueError(ErrorMessages.EPISODE_OUT_OF_RANGE.format(
-                index=episode_index, max_range=total_episodes-1
+            raise ValueError(ErrorMessages.episode_out_of_range(
+                episode_index, total_episodes-1
             ))
-        
+
+        return self.get_episode_info_unchecked(episode_index)
+
+    def get_episode_info_unchecked(self, episode_index: int) -> Dict[str, Any]:
+        """
+        Get episode information without the bounds check.
+
+        Fast path for callers that have already validated the index
+        against the episode count.
+
+        Args:
+            episode_index: Index of the episode to retrieve
+
+        Returns:
+            Dictionary containing episode information
+        """
         # Get episode metadata
         episode_meta = self.metadata.get_episode_metadata(episode_index)
         if not episode_meta:
@@ -73,6 +95,69 @@ class DatasetOperations:
             "videos_exist": existence['videos']
         }
     
+    def get_episode_infos(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Get information for a contiguous range of episodes in one pass.
+
+        Shares a single metadata index and video-feature lookup across the
+        whole range instead of re-deriving them per episode.
+
+        Args:
+            start: First episode index (inclusive)
+            end: Last episode index (exclusive)
+
+        Returns:
+            List of episode information dictionaries; entries for episodes
+            that cannot be read carry an "error" key instead
+        """
+        total_episodes = self.metadata.get_episode_count()
+        start = max(start, 0)
+        end = min(end, total_episodes)
+
+        video_features = self.metadata.get_video_features()
+        metadata_by_index = {
+            episode.get("episode_index"): episode
+            for episode in self.metadata.episodes
+        }
+
+        def build_info(episode_index: int) -> Dict[str, Any]:
+            episode_meta = metadata_by_index.get(episode_index)
+            if not episode_meta:
+                episode_meta = {
+                    "episode_index": episode_index,
+                    "length": DEFAULT_FRAME_LENGTH,
+                    "tasks": DEFAULT_TASK_LIST
+                }
+
+            paths = self.file_manager.get_episode_file_paths(episode_index, video_features)
+            existence = self.file_manager.check_episode_files_exist(paths)
+
+            if not existence['data']:
+                return {
+                    "episode_index": episode_index,
+                    "error": f"Episode {episode_index} data file not found: {paths['data']}"
+                }
+
+            return {
+                "episode_index": episode_index,
+                "length": episode_meta.get("length", DEFAULT_FRAME_LENGTH),
+                "tasks": episode_meta.get("tasks", DEFAULT_TASK_LIST),
+                "data_file": paths['data'],
+                "video_files": paths['videos'],
+                "data_exists": existence['data'],
+                "videos_exist": existence['videos']
+            }
+
+        indices = range(start, end)
+        if len(indices) <= 1:
+            return [build_info(i) for i in indices]
+
+        # The per-episode work is stat syscalls; overlapping them in a
+        # thread pool keeps the wall time near one stat's latency, which
+        # matters most on network filesystems. map() preserves order.
+        with ThreadPoolExecutor(max_workers=min(32, len(indices))) as executor:
+            return list(executor.map(build_info, indices))
+
     def delete_episode(self, episode_index: int, dry_run: bool = False) -> bool:
         """
         Delete a specific episode and renumber all subsequent episodes.
@@ -86,30 +171,32 @@ class DatasetOperations:
         """
         total_episodes = self.metadata.get_episode_count()
         if episode_index < 0 or episode_index >= total_episodes:
-            print(ErrorMessages.EPISODE_OUT_OF_RANGE.format(
-                index=episode_index, max_range=total_episodes-1
+            print(ErrorMessages.episode_out_of_range(
+                episode_index, total_episodes-1
             ))
             return False
         
         try:
+            # Looked up once and shared by the delete and renumber steps
+            video_features = self.metadata.get_video_features()
+
             episode_info = self.get_episode_info(episode_index)
-            
+
             if dry_run:
                 self._show_delete_dry_run(episode_index, episode_info, total_episodes)
                 return True
-            
+
             print(f"\nDeleting episode {episode_index}...")
-            
+
             # Delete files
-            video_features = self.metadata.get_video_features()
             paths = self.file_manager.get_episode_file_paths(episode_index, video_features)
             deleted_files = self.file_manager.delete_episode_files(paths)
-            
+
             for file_path in deleted_files:
                 print(f"Deleted: {file_path}")
-            
+
             # Renumber subsequent episodes
-            self._renumber_episodes_after_deletion(episode_index, total_episodes)
+            self._renumber_episodes_after_deletion(episode_index, total_episodes, video_features)
             
             # Update metadata
             self.metadata.remove_episode(episode_index)
@@ -118,11 +205,11 @@ class DatasetOperations:
             # Clean up empty directories
             self.file_manager.cleanup_empty_directories()
             
-            print(SuccessMessages.EPISODE_DELETED.format(index=episode_index))
+            print(SuccessMessages.episode_deleted(episode_index))
             return True
             
         except Exception as e:
-            print(ErrorMessages.EPISODE_DELETE_ERROR.format(index=episode_index, error=e))
+            print(ErrorMessages.episode_delete_error(episode_index, e))
             return False
     
     def copy_episode_with_new_instruction(self, source_episode_index: int, new_instruction: str, dry_run: bool = False) -> bool:
@@ -139,8 +226,8 @@ class DatasetOperations:
         """
         total_episodes = self.metadata.get_episode_count()
         if source_episode_index < 0 or source_episode_index >= total_episodes:
-            print(ErrorMessages.EPISODE_OUT_OF_RANGE.format(
-                index=source_episode_index, max_range=total_episodes-1
+            print(ErrorMessages.episode_out_of_range(
+                source_episode_index, total_episodes-1
             ))
             return False
         
@@ -174,20 +261,18 @@ class DatasetOperations:
             self.metadata.add_episode(target_index, source_info['length'], [new_instruction])
             self.metadata.save_metadata()
             
-            print(SuccessMessages.EPISODE_COPIED.format(
-                source=source_episode_index, 
-                target=target_index, 
-                instruction=new_instruction
+            print(SuccessMessages.episode_copied(
+                source_episode_index, target_index, new_instruction
             ))
             return True
             
         except Exception as e:
-            print(ErrorMessages.EPISODE_COPY_ERROR.format(index=source_episode_index, error=e))
+            print(ErrorMessages.episode_copy_error(source_episode_index, e))
             return False
     
     def _show_delete_dry_run(self, episode_index: int, episode_info: Dict[str, Any], total_episodes: int) -> None:
         """Show what would be deleted in a dry run."""
-        print(f"\n=== {SuccessMessages.DRY_RUN_DELETE.format(index=episode_index)} ===")
+        print(f"\n=== {SuccessMessages.dry_run_delete(episode_index)} ===")
         print(f"Data file: {episode_info['data_file']}")
         
         for video_key, video_path in episode_info['video_files'].items():
@@ -197,7 +282,7 @@ class DatasetOperations:
     
     def _show_copy_dry_run(self, source_index: int, target_index: int, source_info: Dict[str, Any], instruction: str) -> None:
         """Show what would be copied in a dry run."""
-        print(f"\n=== {SuccessMessages.DRY_RUN_COPY.format(source=source_index, target=target_index)} ===")
+        print(f"\n=== {SuccessMessages.dry_run_copy(source_index, target_index)} ===")
         print(f"Source data file: {source_info['data_file']}")
         
         for video_key, video_path in source_info['video_files'].items():
@@ -205,20 +290,47 @@ class DatasetOperations:
         
         print(f"New instruction: {instruction}")
     
-    def _renumber_episodes_after_deletion(self, deleted_index: int, total_episodes: int) -> None:
+    def _renumber_episodes_after_deletion(self, deleted_index: int, total_episodes: int,
+                                          video_features: Optional[Dict[str, Any]] = None) -> None:
         """
         Renumber all episodes after the deleted episode index.
-        
+
         Args:
             deleted_index: Index of the deleted episode
             total_episodes: Total number of episodes before deletion
+            video_features: Video features already looked up by the caller
         """
-        video_features = self.metadata.get_video_features()
-        
-        # Renumber data files and video files
+        # Nothing to renumber when the last episode was deleted
+        if deleted_index >= total_episodes - 1:
+            return
+
+        if video_features is None:
+            video_features = self.metadata.get_video_features()
+
+        # Collect every pending rename first, then let the file manager
+        # issue them in one pass with destination directories created once
+        moves = []
+        renumbered_data = []
         for current_index in range(deleted_index + 1, total_episodes):
-            new_index = current_index - 1
-            self.file_manager.renumber_episode_files(current_index, new_index, video_features)
+            old_paths = self.file_manager.get_episode_file_paths(current_index, video_features)
+            new_paths = self.file_manager.get_episode_file_paths(current_index - 1, video_features)
+
+            if old_paths['data'].exists():
+                moves.append((old_paths['data'], new_paths['data']))
+                renumbered_data.append((new_paths['data'], current_index - 1))
+
+            for video_key, old_video_path in old_paths['videos'].items():
+                if old_video_path.exists():
+                    moves.append((old_video_path, new_paths['videos'][video_key]))
+
+        self.file_manager.move_files_batch(moves)
+
+        # Bring the episode_index column in line with each file's new
+        # slot. The footer-statistics fast path makes this a metadata
+        # read for files that already carry the right value, so only
+        # genuinely stale files pay for a rewrite.
+        for data_path, new_index in renumbered_data:
+            self._update_episode_indices_in_parquet(data_path, new_index)
     
     def _update_episode_indices_in_parquet(self, parquet_path: Path, new_episode_index: int) -> None:
         """
@@ -229,10 +341,48 @@ class DatasetOperations:
             new_episode_index: New episode index to set
         """
         try:
-            df = pd.read_parquet(parquet_path)
-            if 'episode_index' in df.columns:
-                df['episode_index'] = new_episode_index
-                df.to_parquet(parquet_path, index=False)
+            # Column statistics tell us in O(1) whether the rewrite is a
+            # no-op; skip reading the data pages entirely in that case
+            metadata = pq.read_metadata(parquet_path)
+            compression = 'snappy'
+            if 'episode_index' in metadata.schema.names:
+                column_index = metadata.schema.names.index('episode_index')
+                already_correct = metadata.num_rows > 0
+                for rg in range(metadata.num_row_groups):
+                    stats = metadata.row_group(rg).column(column_index).statistics
+                    if stats is None or not (stats.min == stats.max == new_episode_index):
+                        already_correct = False
+                        break
+                if already_correct:
+                    return
+            if metadata.num_row_groups > 0:
+                # Keep the source codec so the rewrite does not silently
+                # recompress every column with a different algorithm
+                compression = metadata.row_group(0).column(0).compression.lower()
+                if compression == 'uncompressed':
+                    compression = 'none'
+
+            parquet_file = pq.ParquetFile(parquet_path)
+            schema = parquet_file.schema_arrow
+            field_index = schema.get_field_index('episode_index')
+            if field_index != -1:
+                # Stream batch by batch so peak memory stays at one batch
+                # instead of the whole episode, replacing just the one
+                # column as we go
+                index_type = schema.field(field_index).type
+                tmp_path = parquet_path.with_suffix(parquet_path.suffix + '.tmp')
+                with pq.ParquetWriter(tmp_path, schema, compression=compression) as writer:
+                    for batch in parquet_file.iter_batches(batch_size=65536):
+                        arrays = batch.columns
+                        arrays[field_index] = pa.array(
+                            np.full(batch.num_rows, new_episode_index),
+                            type=index_type
+                        )
+                        writer.write_batch(
+                            pa.RecordBatch.from_arrays(arrays, schema=schema)
+                        )
+                parquet_file.close()
+                os.replace(tmp_path, parquet_path)
         except Exception as e:
             print(f"Warning: Could not update episode indices in {parquet_path}: {e}")
     
@@ -394,39 +544,41 @@ class DatasetOperations:
         """Copy episodes from source dataset to merged dataset."""
         source_episodes = source_ops.metadata.get_all_episodes()
         video_features = source_ops.metadata.get_video_features()
-        episodes_copied = 0
-        
-        for episode in source_episodes:
+        output_file_manager = FileSystemManager(output_path)
+
+        def copy_one(episode: Dict[str, Any]) -> bool:
             source_index = episode['episode_index']
             target_index = source_index + episode_offset
-            
-            # Get source file paths
+
             source_paths = source_ops.file_manager.get_episode_file_paths(source_index, video_features)
-            
-            # Create target file paths in the merged dataset
-            output_file_manager = FileSystemManager(output_path)
             target_paths = output_file_manager.get_episode_file_paths(target_index, video_features)
-            
-            # Copy files
-            if source_paths['data'].exists():
-                # Copy and update episode indices in parquet file
-                target_paths['data'].parent.mkdir(parents=True, exist_ok=True)
-                df = pd.read_parquet(source_paths['data'])
-                if 'episode_index' in df.columns:
-                    df['episode_index'] = target_index
-                df.to_parquet(target_paths['data'], index=False)
-                
-                # Copy video files
-                for video_key, source_video_path in source_paths['videos'].items():
-                    if source_video_path.exists():
-                        target_video_path = target_paths['videos'][video_key]
-                        target_video_path.parent.mkdir(parents=True, exist_ok=True)
-                        import shutil
-                        shutil.copy2(source_video_path, target_video_path)
-                
-                episodes_copied += 1
-        
-        return episodes_copied
+
+            if not source_paths['data'].exists():
+                return False
+
+            # Clone the bytes on the kernel fast path, then stream the
+            # episode_index rewrite batch by batch so a merge never
+            # holds a whole episode table in memory
+            target_paths['data'].parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(str(source_paths['data']), str(target_paths['data']))
+            self._update_episode_indices_in_parquet(target_paths['data'], target_index)
+
+            # Copy video files
+            for video_key, source_video_path in source_paths['videos'].items():
+                if source_video_path.exists():
+                    target_video_path = target_paths['videos'][video_key]
+                    target_video_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(str(source_video_path), str(target_video_path))
+
+            return True
+
+        # Episodes land in distinct target slots, so their copies and
+        # rewrites can overlap across cores
+        if len(source_episodes) > 1:
+            workers = min(os.cpu_count() or 4, len(source_episodes))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return sum(executor.map(copy_one, source_episodes))
+        return sum(map(copy_one, source_episodes))
     
     def _merge_episodes_metadata(self, merged_episodes: List[Dict], source_episodes: List[Dict], 
                                episode_offset: int, task_mapping: Optional[Dict[str, str]]) -> None:
@@ -434,14 +586,18 @@ class DatasetOperations:
         for episode in source_episodes:
             merged_episode = episode.copy()
             merged_episode['episode_index'] = episode['episode_index'] + episode_offset
-            
-            # Apply task mapping if provided
-            if task_mapping and 'tasks' in merged_episode:
-                mapped_tasks = []
-                for task in merged_episode['tasks']:
-                    mapped_tasks.append(task_mapping.get(task, task))
-                merged_episode['tasks'] = mapped_tasks
-            
+
+            # Apply task mapping if provided. Episodes reference tasks
+            # by name, so only records that actually mention a mapped
+            # name pay for a rewrite; everything else keeps its lists
+            if task_mapping:
+                task = merged_episode.get('task')
+                if task in task_mapping:
+                    merged_episode['task'] = task_mapping[task]
+                tasks = merged_episode.get('tasks')
+                if tasks and any(task in task_mapping for task in tasks):
+                    merged_episode['tasks'] = [task_mapping.get(task, task) for task in tasks]
+
             merged_episodes.append(merged_episode)
     
     def _merge_tasks_metadata(self, merged_tasks: Dict, source_tasks: Dict, 
@@ -464,11 +620,10 @@ class DatasetOperations:
                             episodes: List[Dict], tasks: Dict[str, Any]) -> None:
         """Save merged metadata to the output dataset."""
         import json
-        
+
         # Save info.json
-        with open(output_path / "meta" / "info.json", 'w') as f:
-            json.dump(info, f, indent=2)
-        
+        write_info(output_path / "meta" / "info.json", info)
+
         # Save episodes.jsonl
         with open(output_path / "meta" / "episodes.jsonl", 'w') as f:
             for episode in episodes:
@@ -515,15 +670,21 @@ class DatasetOperations:
             
             # Filter episodes
             source_episodes = self.metadata.get_all_episodes()
-            filtered_count = 0
-            
-            for episode in source_episodes:
-                episode_index = episode['episode_index']
-                success = self._filter_episode_data(
-                    episode_index, output_path, features_to_keep, frame_range
+
+            def filter_one(episode: Dict[str, Any]) -> bool:
+                return self._filter_episode_data(
+                    episode['episode_index'], output_path, features_to_keep, frame_range
                 )
-                if success:
-                    filtered_count += 1
+
+            # Each episode rewrite is independent and Arrow releases the
+            # GIL while (de)compressing pages, so a thread pool scales
+            # across cores without process-spawn overhead
+            if len(source_episodes) > 1:
+                workers = min(os.cpu_count() or 4, len(source_episodes))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    filtered_count = sum(executor.map(filter_one, source_episodes))
+            else:
+                filtered_count = sum(map(filter_one, source_episodes))
             
             # Create filtered metadata
             filtered_info = self._create_filtered_info(all_features, features_to_keep)
@@ -609,26 +770,34 @@ class DatasetOperations:
                 print(f"Warning: Episode {episode_index} data file not found")
                 return False
             
-            df = pd.read_parquet(source_paths['data'])
-            
-            # Apply frame range filter
-            if frame_range:
-                start_frame, end_frame = frame_range
-                df = df[(df['frame_index'] >= start_frame) & (df['frame_index'] <= end_frame)]
-            
-            # Filter columns to keep only desired features
+            # Resolve kept columns against the footer schema so excluded
+            # features are never read or decompressed at all
+            schema_names = set(pq.read_schema(source_paths['data']).names)
             columns_to_keep = ['episode_index', 'frame_index', 'timestamp']
             for feature in features_to_keep:
-                if feature in df.columns:
+                if feature in schema_names:
                     columns_to_keep.append(feature)
-            
-            filtered_df = df[columns_to_keep]
-            
+
+            # Push the frame-range predicate into the parquet scan so
+            # row groups whose min/max statistics fall outside the range
+            # are skipped without decompressing their pages
+            filters = None
+            if frame_range:
+                start_frame, end_frame = frame_range
+                filters = (
+                    (pc.field('frame_index') >= start_frame)
+                    & (pc.field('frame_index') <= end_frame)
+                )
+            filtered_table = pq.read_table(
+                source_paths['data'], columns=columns_to_keep,
+                filters=filters, use_threads=True
+            )
+
             # Save filtered parquet data
             output_file_manager = FileSystemManager(output_path)
             target_paths = output_file_manager.get_episode_file_paths(episode_index, {})
             target_paths['data'].parent.mkdir(parents=True, exist_ok=True)
-            filtered_df.to_parquet(target_paths['data'], index=False)
+            pq.write_table(filtered_table, target_paths['data'])
             
             # Copy video files for kept video features
             video_features_to_keep = {k: v for k, v in video_features.items() if k in features_to_keep}
@@ -638,8 +807,7 @@ class DatasetOperations:
                     if video_key in features_to_keep and source_video_path.exists():
                         target_video_path = target_video_paths['videos'][video_key]
                         target_video_path.parent.mkdir(parents=True, exist_ok=True)
-                        import shutil
-                        shutil.copy2(source_video_path, target_video_path)
+                        shutil.copyfile(str(source_video_path), str(target_video_path))
             
             return True
             
@@ -3,43 +3,54 @@ End-to-end tests for CLI functionality.
 """
 
 import json
+import re
 import pytest
 from pathlib import Path
 
+# Expected output fragments shared across tests, built once at import
+EPISODE_LINES = tuple(f"Episode      {i}:" for i in range(10))
+EPISODE_LINE_RE = re.compile(r"Episode\s+(\d+):")
+
 
 class TestCLIBasicCommands:
     """Test basic CLI commands and functionality."""
     
-    def test_help_command(self, cli_runner):
+    def test_help_command(self, cli_runner, assert_contains_all):
         """Test that help command works."""
         result = cli_runner(["--help"])
         assert result.returncode == 0
-        assert "LERO - LeRobot dataset Operations toolkit" in result.stdout
-        assert "--summary" in result.stdout
-        assert "--tasks" in result.stdout
-        assert "--list" in result.stdout
-        assert "--gui" in result.stdout
-    
-    def test_dataset_summary(self, cli_runner, sample_dataset):
+        assert_contains_all(result.stdout, [
+            "LERO - LeRobot dataset Operations toolkit",
+            "--summary",
+            "--tasks",
+            "--list",
+            "--gui"
+        ])
+
+    def test_dataset_summary(self, cli_runner_cached, readonly_sample_dataset, assert_contains_all):
         """Test dataset summary command."""
-        result = cli_runner(["--summary", str(sample_dataset)])
+        result = cli_runner_cached(["--summary", str(readonly_sample_dataset)])
         assert result.returncode == 0
-        assert "Dataset Summary" in result.stdout
-        assert "Total episodes: 3" in result.stdout
-        assert "Total tasks: 2" in result.stdout
-        assert "Robot type: so100" in result.stdout
-    
-    def test_list_tasks(self, cli_runner, sample_dataset):
+        assert_contains_all(result.stdout, [
+            "Dataset Summary",
+            "Total episodes: 3",
+            "Total tasks: 2",
+            "Robot type: so100"
+        ])
+
+    def test_list_tasks(self, cli_runner, sample_dataset, assert_contains_all):
         """Test tasks list command."""
         result = cli_runner(["--tasks", str(sample_dataset)])
         assert result.returncode == 0
-        assert "=== Tasks" in result.stdout
-        assert "Task   0:" in result.stdout
-        assert "Task   1:" in result.stdout
-        assert "Pick up the red block" in result.stdout
-        assert "Place the block in container" in result.stdout
-        # Check that episode counts and episodes are displayed
-        assert "episodes:" in result.stdout
+        assert_contains_all(result.stdout, [
+            "=== Tasks",
+            "Task   0:",
+            "Task   1:",
+            "Pick up the red block",
+            "Place the block in container",
+            # Episode counts and episodes should be displayed
+            "episodes:"
+        ])
         # Based on test data: episodes 0,2 use task 0, episode 1 uses task 1
         assert "2 episodes: 0, 2" in result.stdout or "1 episodes: 1" in result.stdout
     
@@ -85,8 +96,9 @@ class TestCLIBasicCommands:
             json.dump(info_data, f)
         
         # Create tasks.jsonl with one task
-        with open(dataset_path / "meta" / "tasks.jsonl", "w") as f:
-            f.write(json.dumps({"task_index": 0, "task": "Test task"}) + "\n")
+        (dataset_path / "meta" / "tasks.jsonl").write_text(
+            json.dumps({"task_index": 0, "task": "Test task"}, separators=(",", ":")) + "\n"
+        )
         
         # Create empty episodes.jsonl
         (dataset_path / "meta" / "episodes.jsonl").touch()
@@ -96,35 +108,27 @@ class TestCLIBasicCommands:
         assert "=== Tasks (1 total) ===" in result.stdout
         assert "Task   0: Test task (0 episodes)" in result.stdout
     
-    def test_dataset_overview_default(self, cli_runner, sample_dataset):
+    def test_dataset_overview_default(self, cli_runner_cached, readonly_sample_dataset):
         """Test default dataset overview (no flags)."""
-        result = cli_runner([str(sample_dataset)])
+        result = cli_runner_cached([str(readonly_sample_dataset)])
         assert result.returncode == 0
         # Should show summary by default when no other action is specified
         assert "Dataset Summary" in result.stdout
     
-    def test_list_episodes_default(self, cli_runner, sample_dataset):
-        """Test listing episodes with default count."""
-        result = cli_runner([str(sample_dataset), "--list"])
+    @pytest.mark.parametrize("list_args,expected_indices", [
+        (["--list"], [0, 1, 2]),
+        (["--list", "2"], [0, 1]),
+        (["--list", "2", "--list-start", "1"], [1, 2]),
+    ], ids=["default", "with_count", "with_start"])
+    def test_list_episodes(self, cli_runner_cached, readonly_sample_dataset,
+                           list_args, expected_indices):
+        """Test listing episodes with default count, a count, and a start index."""
+        # Path first so a bare --list (optional count) cannot swallow it
+        result = cli_runner_cached([str(readonly_sample_dataset)] + list_args)
         assert result.returncode == 0
         assert "=== Episodes" in result.stdout
-        assert "Episode      0:" in result.stdout
-        assert "Episode      1:" in result.stdout
-        assert "Episode      2:" in result.stdout
-    
-    def test_list_episodes_with_count(self, cli_runner, sample_dataset):
-        """Test listing episodes with specific count."""
-        result = cli_runner(["--list", "2", str(sample_dataset)])
-        assert result.returncode == 0
-        assert "Episode      0:" in result.stdout
-        assert "Episode      1:" in result.stdout
-    
-    def test_list_episodes_with_start(self, cli_runner, sample_dataset):
-        """Test listing episodes with start index."""
-        result = cli_runner(["--list", "2", "--list-start", "1", str(sample_dataset)])
-        assert result.returncode == 0
-        assert "Episode      1:" in result.stdout
-        assert "Episode      2:" in result.stdout
+        for i in expected_indices:
+            assert EPISODE_LINES[i] in result.stdout
     
     def test_show_specific_episode(self, cli_runner, sample_dataset):
         """Test showing specific episode details."""
@@ -208,68 +212,71 @@ class TestCLIValidation:
 class TestCLIOutput:
     """Test CLI output formatting and content."""
     
-    def test_output_contains_expected_sections(self, cli_runner, sample_dataset):
+    def test_output_contains_expected_sections(self, cli_runner_cached, readonly_sample_dataset, assert_contains_all):
         """Test that summary output contains expected sections."""
-        result = cli_runner(["--summary", str(sample_dataset)])
+        result = cli_runner_cached(["--summary", str(readonly_sample_dataset)])
         assert result.returncode == 0
-        
+
         # Check for expected sections in output
         output = result.stdout
         assert "Dataset Path:" in output or "Path:" in output
-        assert "Total episodes:" in output
-        assert "Total tasks:" in output
-        assert "Robot type:" in output
-        assert "FPS:" in output
+        assert_contains_all(output, [
+            "Total episodes:",
+            "Total tasks:",
+            "Robot type:",
+            "FPS:"
+        ])
     
-    def test_episode_list_formatting(self, cli_runner, sample_dataset):
+    def test_episode_list_formatting(self, cli_runner_cached, readonly_sample_dataset):
         """Test episode list formatting."""
-        result = cli_runner([str(sample_dataset), "--list"])
+        result = cli_runner_cached([str(readonly_sample_dataset), "--list"])
         assert result.returncode == 0
         
         # Check for proper episode formatting
         output = result.stdout
-        assert "Episode      0:" in output
-        assert "Episode      1:" in output
-        assert "Episode      2:" in output
+        for line in EPISODE_LINES[:3]:
+            assert line in output
     
-    def test_episode_detail_formatting(self, cli_runner, sample_dataset):
+    def test_episode_detail_formatting(self, cli_runner, sample_dataset, assert_contains_all):
         """Test individual episode detail formatting."""
         result = cli_runner(["--episode", "0", str(sample_dataset)])
         assert result.returncode == 0
         
         output = result.stdout
-        assert "=== Episode 0 ===" in output
-        assert "Length:" in output
-        assert "Data file:" in output
-        assert "Video files:" in output
+        assert_contains_all(output, [
+            "=== Episode 0 ===",
+            "Length:",
+            "Data file:",
+            "Video files:"
+        ])
 
 
 class TestCLIIntegration:
     """Test CLI integration with the underlying system."""
     
-    def test_cli_reads_real_dataset_structure(self, cli_runner, sample_dataset, dataset_validator):
+    def test_cli_reads_real_dataset_structure(self, cli_runner_cached, readonly_sample_dataset, dataset_validator):
         """Test that CLI correctly reads and reports dataset structure."""
         # Validate our test dataset is properly structured
-        validation = dataset_validator(sample_dataset)
+        validation = dataset_validator(readonly_sample_dataset)
         assert validation["valid"], f"Test dataset invalid: {validation['errors']}"
-        
+
         # Test CLI can read it
-        result = cli_runner(["--summary", str(sample_dataset)])
+        result = cli_runner_cached(["--summary", str(readonly_sample_dataset)])
         assert result.returncode == 0
         
         # Verify CLI reports correct information
         assert "Total episodes: 3" in result.stdout
         assert "Total tasks: 2" in result.stdout
     
-    def test_cli_episode_enumeration(self, cli_runner, sample_dataset):
+    def test_cli_episode_enumeration(self, cli_runner_cached, readonly_sample_dataset):
         """Test that CLI correctly enumerates all episodes."""
-        result = cli_runner(["--list", "10", str(sample_dataset)])  # Request more than available
+        result = cli_runner_cached(["--list", "10", str(readonly_sample_dataset)])  # Request more than available
         assert result.returncode == 0
         
-        # Should show all 3 episodes
-        output = result.stdout
-        for i in range(3):
-            assert f"Episode      {i}:" in output
+        # Should show all 3 episodes; one regex pass instead of a
+        # substring scan per index
+        found = set(map(int, EPISODE_LINE_RE.findall(result.stdout)))
+        assert {0, 1, 2}.issubset(found)
     
     def test_cli_episode_details_accuracy(self, cli_runner, sample_dataset, episode_data_reader):
         """Test that CLI episode details match actual data."""
@@ -290,26 +297,16 @@ class TestCLIIntegration:
 class TestCLIPerformance:
     """Test CLI performance and responsiveness."""
     
-    def test_cli_startup_time(self, cli_runner, sample_dataset):
+    def test_cli_startup_time(self, benchmark, subprocess_cli_runner, sample_dataset):
         """Test that CLI starts up reasonably quickly."""
-        import time
-        
-        start_time = time.time()
-        result = cli_runner(["--help"])
-        end_time = time.time()
-        
+        # benchmark gives statistics for regression tracking; the hard
+        # ceiling stays as a backstop against pathological slowdowns
+        result = benchmark(subprocess_cli_runner, ["--help"])
         assert result.returncode == 0
-        startup_time = end_time - start_time
-        assert startup_time < 5.0, f"CLI startup took {startup_time:.2f}s, should be under 5s"
-    
-    def test_cli_summary_performance(self, cli_runner, sample_dataset):
+        assert benchmark.stats is None or benchmark.stats["mean"] < 5.0
+
+    def test_cli_summary_performance(self, benchmark, cli_runner, sample_dataset):
         """Test that summary generation is reasonably fast."""
-        import time
-        
-        start_time = time.time()
-        result = cli_runner(["--summary", str(sample_dataset)])
-        end_time = time.time()
-        
+        result = benchmark(cli_runner, ["--summary", str(sample_dataset)])
         assert result.returncode == 0
-        processing_time = end_time - start_time
-        assert processing_time < 10.0, f"Summary took {processing_time:.2f}s, should be under 10s"
\ No newline at end of file
+        assert benchmark.stats is None or benchmark.stats["mean"] < 10.0
\ No newline at end of file
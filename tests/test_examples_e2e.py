@@ -11,7 +11,7 @@ from pathlib import Path
 class TestExampleScripts:
     """Test example scripts work correctly."""
     
-    def test_batch_copy_episodes_python_help(self):
+    def test_batch_copy_episodes_python_help(self, assert_contains_all):
         """Test Python batch copy script shows help."""
         script_path = Path("examples/batch_copy_episodes.py")
         
@@ -20,11 +20,13 @@ class TestExampleScripts:
         ], capture_output=True, text=True)
         
         assert result.returncode == 0
-        assert "Batch copy episodes" in result.stdout
-        assert "--episodes" in result.stdout
-        assert "--instruction" in result.stdout
+        assert_contains_all(result.stdout, [
+            "Batch copy episodes",
+            "--episodes",
+            "--instruction"
+        ])
     
-    def test_batch_copy_episodes_shell_help(self):
+    def test_batch_copy_episodes_shell_help(self, assert_contains_all):
         """Test shell batch copy script shows help."""
         script_path = Path("examples/batch_copy_episodes.sh")
         
@@ -36,9 +38,11 @@ class TestExampleScripts:
         ], capture_output=True, text=True)
         
         assert result.returncode == 0
-        assert "Usage:" in result.stdout
-        assert "episode_numbers" in result.stdout
-        assert "instruction" in result.stdout
+        assert_contains_all(result.stdout, [
+            "Usage:",
+            "episode_numbers",
+            "instruction"
+        ])
     
     def test_analyze_dataset_help(self):
         """Test analyze dataset script shows help."""